@@ -1,8 +1,9 @@
 #!/usr/bin/env python3
 # /// script
-# requires-python = ">=3.8"
+# requires-python = ">=3.12"
 # dependencies = [
 #     "urwid>=2.6.0",
+#     "orjson>=3.9",
 # ]
 # description = "Job application tracking TUI application"
 # authors = ["Generated for standalone execution"]
@@ -17,18 +18,130 @@ Run with: uv run planner.py
 """
 
 import urwid
+import asyncio
 import sys
 import signal
+import threading
 from typing import List, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
+from bisect import bisect_right
+from collections import Counter
+from operator import itemgetter
 import json
 import os
-from datetime import datetime, timedelta
+from datetime import date, datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+
+# Pretty-print the save file only when debugging; indenting is the single
+# largest cost of serialization and the file is not meant to be hand-edited.
+PRETTY_JSON = bool(os.environ.get("JOB_TRACKER_DEBUG"))
+
+
+def _loads(data: bytes):
+    """Decode JSON bytes, preferring orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Files written by the stdlib encoder may hold lone surrogate
+            # escapes ("\ud83d") that orjson rejects but json accepts
+            pass
+    return json.loads(data)
+
+
+def _dumps(obj) -> bytes:
+    """Encode an object to JSON bytes, preferring orjson when it is installed."""
+    indent = 2 if PRETTY_JSON else None
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if PRETTY_JSON else 0)
+        except orjson.JSONEncodeError:
+            pass  # Lone surrogates; only the stdlib encoder can escape them
+    try:
+        return json.dumps(obj, indent=indent, ensure_ascii=False).encode("utf-8")
+    except UnicodeEncodeError:
+        # Escape them as the original json.dump did, so the file round-trips
+        return json.dumps(obj, indent=indent).encode("ascii")
+
+
+def _date_key(date_str: str) -> Optional[int]:
+    """Turn a YYYY-MM-DD string into a sortable YYYYMMDD int, or None if malformed.
+
+    The key comes from the same validated parse the rest of the app uses,
+    so dates like "2024-1-5" sort in place and "2024-02-30" sorts as malformed.
+    """
+    parsed = _parse_ymd(date_str)
+    if parsed is None:
+        return None
+    return parsed.year * 10000 + parsed.month * 100 + parsed.day
+
+
+@lru_cache(maxsize=4096)
+def _parse_ymd(date_str: str) -> Optional[datetime]:
+    """Parse a YYYY-MM-DD string to a datetime, or None if malformed.
+
+    Jobs share a small set of dates that every refresh checks again, so
+    parses are cached by string.
+    """
+    if not date_str:
+        return None  # Unset fields, including null in the save file
+    try:
+        digits = date_str[0:4] + date_str[5:7] + date_str[8:10]
+        if (len(date_str) == 10 and date_str[4] == date_str[7] == "-"
+                and digits.isascii() and digits.isdecimal()):
+            # Canonical dates skip strptime's format machinery; datetime()
+            # still rejects out-of-range months and days
+            return datetime(int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]))
+        return datetime.strptime(date_str, "%Y-%m-%d")  # e.g. "2024-1-5"
+    except ValueError:
+        return None
+
+
+# Available status options in order
+_STATUS_OPTIONS = ("Applied", "Interview", "Offer", "Rejected", "Withdrawn")
+
+# Status picked by each number key in the bulk status dialog ("1" = first option)
+_STATUS_BY_NUMBER_KEY = {
+    str(i + 1): status for i, status in enumerate(_STATUS_OPTIONS)
+}
+
+# Status that follows each status when cycling with [s]
+_NEXT_STATUS = {
+    status: _STATUS_OPTIONS[(i + 1) % len(_STATUS_OPTIONS)]
+    for i, status in enumerate(_STATUS_OPTIONS)
+}
+
+_STATUS_EMOJI = {
+    "Applied": "📋",
+    "Interview": "🎯",
+    "Offer": "✅",
+    "Rejected": "❌",
+    "Withdrawn": "🚫",
+}
+
+# Timeline progress markers for each status
+_STATUS_PROGRESS = {
+    "Applied": "●",
+    "Interview": "●●",
+    "Offer": "●●●",
+    "Rejected": "●○○",
+    "Withdrawn": "○○○",
+}
+
+
+@dataclass(slots=True, eq=False)
 class JobApplication:
-    """Job application data structure."""
+    """Job application data structure.
+
+    Jobs compare by identity, so list lookups never walk every field, and
+    use slots for compact instances with fast attribute access.
+    """
 
     company: str
     position: str
@@ -56,83 +169,222 @@ class JobApplication:
     recruiter_email: str = ""
     recruiter_phone: str = ""
 
-    @staticmethod
-    def get_status_options():
-        """Get available status options in order."""
-        return ["Applied", "Interview", "Offer", "Rejected", "Withdrawn"]
-
-    @staticmethod
-    def get_status_emoji(status: str) -> str:
-        """Get emoji for status."""
-        emoji_map = {
-            "Applied": "📋",
-            "Interview": "🎯",
-            "Offer": "✅",
-            "Rejected": "❌",
-            "Withdrawn": "🚫",
-        }
-        return emoji_map.get(status, "📋")
-
-    def has_upcoming_interview(self, days_ahead: int = 7) -> bool:
+    # Cached row text, filter text, date sort key and (day, indicator,
+    # attention level); call invalidate() after changing any field
+    _display: Optional[str] = field(default=None, init=False, repr=False)
+    _search_key: Optional[str] = field(default=None, init=False, repr=False)
+    _date_sort: Optional[int] = field(default=None, init=False, repr=False)
+    _urgency: Optional[tuple] = field(default=None, init=False, repr=False)
+
+    def invalidate(self):
+        """Drop cached derived values after a field has changed."""
+        self._display = None
+        self._search_key = None
+        self._date_sort = None
+        self._urgency = None
+
+    def get_display_text(self) -> str:
+        """Get the status, company, position, date and interview part of a list row."""
+        if self._display is None:
+            interview_info = ""
+            if self.interview_date:
+                interview_info = f" | Int: {self.interview_date}"
+                if self.interview_time:
+                    interview_info += f" {self.interview_time}"
+            self._display = f"[{self.status.upper()}] {self.company} - {self.position} ({self.date_applied}){interview_info}"
+        return self._display
+
+    def get_date_key(self) -> int:
+        """Get date_applied as a sortable YYYYMMDD int, or -1 if malformed."""
+        if self._date_sort is None:
+            # Derived from _parse_ymd, so a date the row shows as valid
+            # never sorts as malformed
+            key = _date_key(self.date_applied)
+            self._date_sort = -1 if key is None else key
+        return self._date_sort
+
+    def get_search_key(self) -> str:
+        """Get the lowercased company and position text that filters match."""
+        if self._search_key is None:
+            # The separator keeps a filter from matching across both fields
+            self._search_key = f"{self.company}\x00{self.position}".lower()
+        return self._search_key
+
+    def has_upcoming_interview(self, days_ahead: int = 7, today: Optional[date] = None) -> bool:
         """Check if job has an interview within the next N days."""
-        if not self.interview_date:
-            return False
-        try:
-            interview_dt = datetime.strptime(self.interview_date, "%Y-%m-%d")
-            today = datetime.now()
-            return today <= interview_dt <= today + timedelta(days=days_ahead)
-        except ValueError:
+        interview_dt = _parse_ymd(self.interview_date)
+        if interview_dt is None:
             return False
-    
-    def has_overdue_followup(self) -> bool:
+        today_ord = (today or date.today()).toordinal()
+        return today_ord < interview_dt.toordinal() <= today_ord + days_ahead
+
+    def has_overdue_followup(self, today: Optional[date] = None) -> bool:
         """Check if job has an overdue follow-up."""
-        if not self.next_followup:
-            return False
-        try:
-            followup_dt = datetime.strptime(self.next_followup, "%Y-%m-%d")
-            return datetime.now().date() > followup_dt.date()
-        except ValueError:
+        followup_dt = _parse_ymd(self.next_followup)
+        if followup_dt is None:
             return False
-            
-    def needs_followup_soon(self, days_ahead: int = 3) -> bool:
+        return followup_dt.toordinal() < (today or date.today()).toordinal()
+
+    def needs_followup_soon(self, days_ahead: int = 3, today: Optional[date] = None) -> bool:
         """Check if job needs follow-up within the next N days."""
-        if not self.next_followup:
-            return False
-        try:
-            followup_dt = datetime.strptime(self.next_followup, "%Y-%m-%d")
-            today = datetime.now()
-            return today <= followup_dt <= today + timedelta(days=days_ahead)
-        except ValueError:
+        followup_dt = _parse_ymd(self.next_followup)
+        if followup_dt is None:
             return False
+        today_ord = (today or date.today()).toordinal()
+        return today_ord < followup_dt.toordinal() <= today_ord + days_ahead
+
+    def _get_urgency(self, today: Optional[date] = None) -> tuple:
+        """Get (day, status indicator, attention level), computed once per day.
+
+        The date predicates only change at midnight, so both values are
+        derived together from one evaluation of each and kept until the
+        day rolls over or the job is edited.
+        """
+        if today is None:
+            today = date.today()
+        urgency = self._urgency
+        if urgency is None or urgency[0] != today:
+            upcoming = self.has_upcoming_interview(today=today)
+            overdue = self.has_overdue_followup(today=today)
+            soon = self.needs_followup_soon(today=today)
+            base_emoji = _STATUS_EMOJI.get(self.status, "📋")
+
+            # Add urgency indicators
+            if upcoming:
+                indicator = f"⏰{base_emoji}"  # Clock for upcoming interview
+            elif overdue:
+                indicator = f"🔴{base_emoji}"  # Red dot for overdue
+            elif soon:
+                indicator = f"🟡{base_emoji}"  # Yellow dot for soon
+            else:
+                indicator = base_emoji
+
+            if overdue:
+                level = "urgent"
+            elif upcoming or soon:
+                level = "soon"
+            else:
+                level = "normal"
 
-    def get_status_indicator(self) -> str:
+            urgency = self._urgency = (today, indicator, level)
+        return urgency
+
+    def get_status_indicator(self, today: Optional[date] = None) -> str:
         """Get enhanced status indicator with urgency flags."""
-        base_emoji = self.get_status_emoji(self.status)
-        
-        # Add urgency indicators
-        if self.has_upcoming_interview():
-            return f"⏰{base_emoji}"  # Clock for upcoming interview
-        elif self.has_overdue_followup():
-            return f"🔴{base_emoji}"  # Red dot for overdue
-        elif self.needs_followup_soon():
-            return f"🟡{base_emoji}"  # Yellow dot for soon
-        else:
-            return base_emoji
+        return self._get_urgency(today)[1]
 
     def needs_attention(self) -> bool:
         """Check if this job needs immediate attention."""
-        return (self.has_upcoming_interview() or 
-                self.has_overdue_followup() or 
-                self.needs_followup_soon())
-    
-    def get_attention_level(self) -> str:
+        return self._get_urgency()[2] != "normal"
+
+    def get_attention_level(self, today: Optional[date] = None) -> str:
         """Get attention level: urgent, soon, or normal."""
-        if self.has_overdue_followup():
-            return "urgent"
-        elif self.has_upcoming_interview() or self.needs_followup_soon():
-            return "soon"
-        else:
-            return "normal"
+        return self._get_urgency(today)[2]
+
+# Quick add prompts as (title, prompt, field, required); prompts are
+# formatted with the template job's company and position and today's date
+_QUICK_ADD_STEPS = (
+    ("Company Name", "Company name (was: {company}):", "company", True),
+    ("Position", "Position (was: {position}):", "position", False),
+    ("Application Date", "Date applied ({today}):", "date_applied", False),
+)
+_QUICK_ADD_STEP_COUNT = len(_QUICK_ADD_STEPS)
+
+# Persisted JobApplication fields, in declaration order
+_JOB_FIELDS = tuple(f.name for f in fields(JobApplication) if f.init)
+_JOB_FIELD_SET = frozenset(_JOB_FIELDS)
+
+
+def _job_from_dict(item: dict) -> JobApplication:
+    """Build a JobApplication from a saved record.
+
+    Records written by this version map straight onto the constructor;
+    older or newer files with unknown keys fall back to a filtered copy.
+    Missing optional fields take the dataclass defaults. The status is
+    interned so every job shares the one string object per status.
+    """
+    try:
+        job = JobApplication(**item)
+    except TypeError:
+        job = JobApplication(**{
+            key: value for key, value in item.items() if key in _JOB_FIELD_SET
+        })
+    if type(job.status) is str:
+        job.status = sys.intern(job.status)
+    return job
+
+
+class JobListWalker(urwid.ListWalker):
+    """List walker that builds job rows only when the ListBox asks for them.
+
+    The ListBox requests just the rows it is about to draw, so a refresh
+    costs the same for ten jobs or ten thousand. Rows come from the
+    make_row callback and are remembered by position until the next
+    set_jobs() or refresh(). Each refresh reads the clock once and passes
+    that date to every row it builds.
+    """
+
+    def __init__(self, make_row, max_rows=200):
+        self._make_row = make_row
+        self._max_rows = max_rows
+        self._jobs = []
+        self._message = None  # Placeholder row shown instead of jobs
+        self._rows = {}  # position -> row widget built since the last change
+        self._today = date.today()
+        self.focus = 0
+
+    def set_jobs(self, jobs, message=None):
+        """Show jobs, or a single message row when message is given."""
+        self._jobs = jobs
+        self._message = message
+        self.refresh()
+
+    def refresh(self):
+        """Rebuild rows on the next redraw after jobs changed in place."""
+        self._rows.clear()
+        self._today = date.today()
+        self.focus = max(0, min(self.focus, len(self) - 1))
+        self._modified()
+
+    def refresh_row(self, position):
+        """Rebuild just the row at position on the next redraw."""
+        self._rows.pop(position, None)
+        self._modified()
+
+    def __len__(self):
+        return 1 if self._message is not None else len(self._jobs)
+
+    def __getitem__(self, position):
+        row = self._rows.get(position)
+        if row is not None:
+            return row
+        if not 0 <= position < len(self):
+            raise IndexError(position)
+        if self._message is not None:
+            return self._message
+        if len(self._rows) >= self._max_rows:
+            self._rows.clear()  # Long scroll; keep only what is drawn next
+        row = self._rows[position] = self._make_row(self._jobs[position], self._today)
+        return row
+
+    def next_position(self, position):
+        if position + 1 >= len(self):
+            raise IndexError(position + 1)
+        return position + 1
+
+    def prev_position(self, position):
+        if position <= 0:
+            raise IndexError(position - 1)
+        return position - 1
+
+    def set_focus(self, position):
+        self.focus = position
+        self._modified()
+
+    def positions(self, reverse=False):
+        if reverse:
+            return range(len(self) - 1, -1, -1)
+        return range(len(self))
 
 
 class JobTrackerApp:
@@ -160,46 +412,81 @@ class JobTrackerApp:
         ("focus_soon", "white", "brown", "bold"),
     ]
 
+    # Seconds to wait after the last change before saving
+    SAVE_DELAY = 0.2
+
+    # Seconds of typing pause before the filter preview recounts
+    PREVIEW_DELAY = 0.05
+
+    # Row widgets kept for reuse; a few screens' worth is plenty
+    ROW_CACHE_SIZE = 200
+
+    # Status priority for sorting (lower number = higher priority)
+    STATUS_PRIORITY = {
+        "Interview": 1,
+        "Applied": 2,
+        "Offer": 3,
+        "Rejected": 4,
+        "Withdrawn": 5,
+    }
+
+    # Normal and focused row attributes for each known status
+    _STATUS_ATTR = {
+        "Applied": ("applied", "focus_applied"),
+        "Interview": ("interview", "focus_interview"),
+        "Offer": ("offer", "focus_offer"),
+        "Rejected": ("rejected", "focus_rejected"),
+        "Withdrawn": ("withdrawn", "focus_withdrawn"),
+    }
+
+    # Row attributes for attention levels, which override the status colors
+    _ATTENTION_ATTR = {
+        "urgent": ("urgent", "focus_urgent"),
+        "soon": ("soon", "focus_soon"),
+    }
+
     def __init__(self):
         self.jobs: List[JobApplication] = []
         self.job_widgets = []
+        self._row_cache = {}  # id(job) -> (rendered row key, row widget), LRU order
         self.main_loop: Optional[urwid.MainLoop] = None
         self.job_file = os.path.expanduser("~/.job_tracker.json")
+        self._saved_payload: Optional[bytes] = None  # Last bytes queued for job_file
+        self._aio_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._save_alarm = None  # Pending debounced save, if any
+        self._preview_alarm = None  # Pending filter preview update, if any
+        self._status_counts = Counter()  # Jobs per status, kept in step with self.jobs
+        self._write_lock = threading.Lock()
+        self._save_seq = 0  # Sequence number of the newest queued payload
+        self._written_seq = 0  # Sequence number of the payload on disk
+        # Invariant header tail; shows ~ instead of the full home path
+        storage_path = self.job_file.replace(os.path.expanduser("~"), "~")
+        self._header_suffix = f" apps - Saved: {storage_path} "
+        self._last_header_state = None
+        self._last_footer_text = None
+        self._search_index = None  # (jobs snapshot, haystack, record starts)
+        self._quick_add_dialog = None  # Built on first quick add, then reused
+        self._job_form_overlay = None  # Built on first add/edit, then reused
+        self._text_dialog = None  # Shared text dialog frame
 
         # Sorting state - simplified to two modes
         self.sort_by_status = False  # False = date only, True = status+date
         self.sort_ascending = False  # Default to descending (newest first)
 
-        # Status priority for sorting (lower number = higher priority)
-        self.status_priority = {
-            "Interview": 1,
-            "Applied": 2,
-            "Offer": 3,
-            "Rejected": 4,
-            "Withdrawn": 5,
-        }
-
         # Search/filter state
         self.filter_text = ""  # Current search filter
         self.filtered_jobs = []  # Jobs after applying filter
         
         # Multi-select state
         self.multi_select_mode = False
-        self.selected_jobs = set()  # Set of job indices that are selected
+        self.selected_jobs = set()  # Selected jobs (they hash by identity)
 
-        # Migration: check for old task file
-        old_task_file = os.path.expanduser("~/.planner_tasks.json")
-        if os.path.exists(old_task_file) and not os.path.exists(self.job_file):
-            self._migrate_from_tasks(old_task_file)
+        # Jobs are read by _deferred_load once the first frame is on screen;
+        # nothing is saved before then, so an early exit can't wipe the file
+        self._loaded = False
 
-        # Load saved jobs
-        self.load_jobs()
-
-        # Apply initial sorting
-        self._sort_jobs()
-        
-        # Initialize filter (no filter initially)
-        self._apply_filter()
+        # Key bindings for the main list
+        self._keymap = self._build_keymap()
 
         # Setup signal handling
         signal.signal(signal.SIGINT, self._signal_handler)
@@ -208,18 +495,39 @@ class JobTrackerApp:
         # Build UI
         self.ui = self._build_ui()
 
+    def _deferred_load(self, loop=None, user_data=None):
+        """Load saved jobs; run from an alarm so startup paints first."""
+        self._loaded = True
+
+        # Load saved jobs; on first run, migrate the old task file if any
+        if not self.load_jobs():
+            self._migrate_from_tasks(os.path.expanduser("~/.planner_tasks.json"))
+        self._status_counts = Counter(job.status for job in self.jobs)
+
+        # Apply initial sorting
+        self._sort_jobs()
+
+        # Initialize filter from the saved preferences
+        self._apply_filter()
+
+        self._refresh_job_list()
+
     def _signal_handler(self, signum, frame):
         """Handle shutdown signals gracefully."""
+        if self._aio_loop is not None and self._aio_loop.is_running():
+            # Unwind the main loop; run() saves once on the way out
+            raise urwid.ExitMainLoop()
         self.save_jobs()
         sys.exit(0)
 
     def _migrate_from_tasks(self, old_file):
         """Migrate old task data to job format."""
         try:
-            with open(old_file, "r") as f:
-                old_data = json.load(f)
+            with open(old_file, "rb") as f:
+                old_data = _loads(f.read())
 
-            # Convert tasks to basic job applications
+            # Convert tasks to basic job applications, all applied today
+            today = datetime.now().strftime("%Y-%m-%d")
             for item in old_data:
                 if isinstance(item, dict) and "text" in item:
                     # Extract company and position from text if possible
@@ -236,7 +544,7 @@ class JobTrackerApp:
                     job = JobApplication(
                         company=company,
                         position=position,
-                        date_applied=datetime.now().strftime("%Y-%m-%d"),
+                        date_applied=today,
                         status="Rejected"
                         if item.get("completed", False)
                         else "Applied",
@@ -249,97 +557,146 @@ class JobTrackerApp:
             # Optionally rename old file to prevent re-migration
             os.rename(old_file, old_file + ".bak")
 
+        except FileNotFoundError:
+            pass  # No old task file to migrate
         except (json.JSONDecodeError, KeyError, IOError):
             pass  # Migration failed, start fresh
 
-    def load_jobs(self):
-        """Load jobs and sort preferences from file if it exists."""
+    def load_jobs(self) -> bool:
+        """Load jobs and sort preferences from file.
+
+        Returns False if there is no job file yet.
+        """
         try:
-            if os.path.exists(self.job_file):
-                with open(self.job_file, "r") as f:
-                    data = json.load(f)
-                    
-                    # Load sort preferences if they exist
-                    if isinstance(data, dict) and "jobs" in data:
-                        # New format with metadata
-                        self.sort_by_status = data.get("sort_by_status", False)
-                        self.sort_ascending = data.get("sort_ascending", False)
-                        self.filter_text = data.get("filter_text", "")
-                        jobs_data = data["jobs"]
-                    else:
-                        # Legacy format - just jobs array
-                        jobs_data = data
-                    
-                    self.jobs = []
-                    for item in jobs_data:
-                        job = JobApplication(
-                            company=item["company"],
-                            position=item["position"],
-                            date_applied=item["date_applied"],
-                            status=item.get("status", "Applied"),
-                            link=item.get("link", ""),
-                            notes=item.get("notes", ""),
-                            # Interview tracking
-                            interview_date=item.get("interview_date", ""),
-                            interview_time=item.get("interview_time", ""),
-                            interview_type=item.get("interview_type", ""),
-                            # Follow-up tracking
-                            last_contact=item.get("last_contact", ""),
-                            next_followup=item.get("next_followup", ""),
-                            # Salary information
-                            salary_min=item.get("salary_min", ""),
-                            salary_max=item.get("salary_max", ""),
-                            salary_offered=item.get("salary_offered", ""),
-                            # Contact information
-                            recruiter_name=item.get("recruiter_name", ""),
-                            recruiter_email=item.get("recruiter_email", ""),
-                            recruiter_phone=item.get("recruiter_phone", ""),
-                        )
-                        self.jobs.append(job)
-        except (json.JSONDecodeError, KeyError, IOError):
+            with open(self.job_file, "rb") as f:
+                raw = f.read()
+                data = _loads(raw)
+
+                # Load sort preferences if they exist
+                if isinstance(data, dict) and "jobs" in data:
+                    # New format with metadata
+                    self.sort_by_status = data.get("sort_by_status", False)
+                    self.sort_ascending = data.get("sort_ascending", False)
+                    self.filter_text = data.get("filter_text", "")
+                    jobs_data = data["jobs"]
+                else:
+                    # Legacy format - just jobs array
+                    jobs_data = data
+
+                self.jobs = [_job_from_dict(item) for item in jobs_data]
+
+                # The file already holds this state; if re-encoding it
+                # yields the same bytes, saving is a no-op until it changes
+                self._saved_payload = raw
+        except FileNotFoundError:
+            return False
+        except (json.JSONDecodeError, KeyError, TypeError, AttributeError, IOError):
             self.jobs = []
+        return True
 
-    def save_jobs(self):
-        """Save jobs and sort preferences to file."""
-        try:
-            # Save in new format with metadata
-            data = {
-                "sort_by_status": self.sort_by_status,
-                "sort_ascending": self.sort_ascending,
-                "filter_text": self.filter_text,
-                "jobs": []
+    def _encode_jobs(self) -> bytes:
+        """Serialize jobs and sort preferences to JSON bytes."""
+        jobs_data = [
+            {
+                "company": job.company,
+                "position": job.position,
+                "date_applied": job.date_applied,
+                "status": job.status,
+                "link": job.link,
+                "notes": job.notes,
+                # Interview tracking
+                "interview_date": job.interview_date,
+                "interview_time": job.interview_time,
+                "interview_type": job.interview_type,
+                # Follow-up tracking
+                "last_contact": job.last_contact,
+                "next_followup": job.next_followup,
+                # Salary information
+                "salary_min": job.salary_min,
+                "salary_max": job.salary_max,
+                "salary_offered": job.salary_offered,
+                # Contact information
+                "recruiter_name": job.recruiter_name,
+                "recruiter_email": job.recruiter_email,
+                "recruiter_phone": job.recruiter_phone,
             }
-            
-            for job in self.jobs:
-                data["jobs"].append(
-                    {
-                        "company": job.company,
-                        "position": job.position,
-                        "date_applied": job.date_applied,
-                        "status": job.status,
-                        "link": job.link,
-                        "notes": job.notes,
-                        # Interview tracking
-                        "interview_date": job.interview_date,
-                        "interview_time": job.interview_time,
-                        "interview_type": job.interview_type,
-                        # Follow-up tracking
-                        "last_contact": job.last_contact,
-                        "next_followup": job.next_followup,
-                        # Salary information
-                        "salary_min": job.salary_min,
-                        "salary_max": job.salary_max,
-                        "salary_offered": job.salary_offered,
-                        # Contact information
-                        "recruiter_name": job.recruiter_name,
-                        "recruiter_email": job.recruiter_email,
-                        "recruiter_phone": job.recruiter_phone,
-                    }
-                )
-            with open(self.job_file, "w") as f:
-                json.dump(data, f, indent=2)
-        except IOError:
-            pass  # Fail silently if we can't save
+            for job in self.jobs
+        ]
+
+        # Save in new format with metadata
+        data = {
+            "sort_by_status": self.sort_by_status,
+            "sort_ascending": self.sort_ascending,
+            "filter_text": self.filter_text,
+            "jobs": jobs_data,
+        }
+        return _dumps(data)
+
+    def save_jobs(self):
+        """Save jobs and sort preferences to file, blocking until written."""
+        queued = self._queue_payload()
+        if queued is not None:
+            self._write_payload(*queued)
+
+    def _schedule_save(self):
+        """Save shortly after the last change, coalescing bursts of edits."""
+        if self.main_loop is None:
+            self.save_jobs()
+            return
+        if self._save_alarm is not None:
+            self.main_loop.remove_alarm(self._save_alarm)
+        self._save_alarm = self.main_loop.set_alarm_in(self.SAVE_DELAY, self._flush_save)
+
+    def _flush_save(self, loop=None, user_data=None):
+        """Alarm callback that performs a scheduled save."""
+        self._save_alarm = None
+        self._save_jobs_in_background()
+
+    def _save_jobs_in_background(self):
+        """Save jobs without blocking the UI on disk I/O.
+
+        The snapshot is encoded here so it is consistent with what is on
+        screen; only the write runs on a worker thread.
+        """
+        if self._aio_loop is None or not self._aio_loop.is_running():
+            self.save_jobs()
+            return
+        queued = self._queue_payload()
+        if queued is not None:
+            self._aio_loop.run_in_executor(None, self._write_payload, *queued)
+
+    def _queue_payload(self):
+        """Encode the current state; return (payload, seq), or None if unchanged."""
+        if not self._loaded:
+            return None  # Don't overwrite the file before it has been read
+        payload = self._encode_jobs()
+        if payload == self._saved_payload:
+            return None  # Nothing changed since the last save
+        self._saved_payload = payload
+        self._save_seq += 1
+        return payload, self._save_seq
+
+    def _write_payload(self, payload: bytes, seq: int):
+        """Write an encoded payload unless a newer one already reached disk."""
+        with self._write_lock:
+            if seq <= self._written_seq:
+                return
+            tmp_file = self.job_file + ".tmp"
+            try:
+                # Write beside the target and rename over it, so a crash or
+                # signal mid-write can never leave a truncated job file
+                with open(tmp_file, "wb") as f:
+                    f.write(payload)
+                    # Make the data durable before the rename can expose it
+                    os.fsync(f.fileno())
+                os.replace(tmp_file, self.job_file)
+                self._written_seq = seq
+            except IOError:
+                self._saved_payload = None  # Fail silently, retry on the next save
+                try:
+                    os.remove(tmp_file)  # Don't leave a partial file behind
+                except OSError:
+                    pass
 
     def _get_sort_display_name(self):
         """Get user-friendly sort mode name."""
@@ -348,19 +705,11 @@ class JobTrackerApp:
     def _build_ui(self):
         """Build the main user interface."""
         # Header with sort information and storage location
-        sort_direction = "↑" if self.sort_ascending else "↓"
-        sort_name = self._get_sort_display_name()
-        job_count = len(self.jobs)
-        storage_path = self.job_file.replace(os.path.expanduser("~"), "~")  # Show ~ instead of full path
-        header_text = f" Job Tracker - Sort: {sort_name} {sort_direction} - {job_count} apps - Saved: {storage_path} "
-        
-        self.header_widget = urwid.AttrMap(
-            urwid.Text(header_text, align="center"),
-            "header"
-        )
+        self.header_widget = urwid.AttrMap(urwid.Text("", align="center"), "header")
+        self._update_header()  # Set initial header text
 
         # Job list
-        self.job_list = urwid.SimpleFocusListWalker([])
+        self.job_list = JobListWalker(self._make_row, self.ROW_CACHE_SIZE)
         self._refresh_job_list()
 
         listbox = urwid.ListBox(self.job_list)
@@ -378,6 +727,18 @@ class JobTrackerApp:
 
     def _update_header(self):
         """Update header with current sort information and storage location."""
+        header_state = (
+            self.sort_by_status,
+            self.sort_ascending,
+            self.filter_text,
+            len(self._get_display_jobs()),
+            len(self.jobs),
+            self.multi_select_mode,
+            len(self.selected_jobs),
+        )
+        if header_state == self._last_header_state:
+            return  # Avoid invalidating the header canvas with identical text
+        
         sort_direction = "↑" if self.sort_ascending else "↓"
         sort_name = self._get_sort_display_name()
         
@@ -396,11 +757,14 @@ class JobTrackerApp:
             selected_count = len(self.selected_jobs)
             multiselect_info = f" Multi-Select: {selected_count} selected -"
             
-        storage_path = self.job_file.replace(os.path.expanduser("~"), "~")  # Show ~ instead of full path
-        header_text = f" Job Tracker - Sort: {sort_name} {sort_direction} -{filter_info}{multiselect_info} {job_count} apps - Saved: {storage_path} "
+        header_text = "".join((
+            " Job Tracker - Sort: ", sort_name, " ", sort_direction, " -",
+            filter_info, multiselect_info, " ", job_count, self._header_suffix,
+        ))
         
         if hasattr(self, 'header_widget'):
             self.header_widget.original_widget.set_text(header_text)
+            self._last_header_state = header_state
             
     def _update_footer(self):
         """Update footer based on current mode."""
@@ -411,14 +775,16 @@ class JobTrackerApp:
                 footer_text = " Multi-Select: [Space] select jobs [Ctrl+A] select all [m] exit multi-select mode "
         else:
             footer_text = " [a]dd [e]dit [d]el [s]tatus [v]iew | [/]filter [i]nfo [l]ine [r]emind [m]ulti | [c]opy | [j/k]nav [q]uit "
+
+        if footer_text == self._last_footer_text:
+            return  # Same guard as the header: keep the canvas cached
             
         if hasattr(self, 'footer_widget'):
             self.footer_widget.original_widget.set_text(footer_text)
+            self._last_footer_text = footer_text
 
     def _refresh_job_list(self):
         """Refresh the job list display."""
-        self.job_list.clear()
-
         # Update header and footer with current info
         self._update_header()
         self._update_footer()
@@ -426,87 +792,77 @@ class JobTrackerApp:
         display_jobs = self._get_display_jobs()
         
         if not display_jobs:
-            if not self.jobs:
+            if not self._loaded:
+                message = "Loading job applications..."
+            elif not self.jobs:
                 # No jobs at all
                 message = "No job applications yet. Press [a] to add one."
             else:
                 # Jobs exist but filter excludes all
                 message = f"No jobs match filter '{self.filter_text}'. Press [/] to change filter."
             
-            self.job_list.append(
-                urwid.Text(
-                    ("body", message),
-                    align="center",
-                )
-            )
-            return
+            self.job_list.set_jobs(display_jobs, urwid.Text(("body", message), align="center"))
+        else:
+            # Rows are built as the ListBox draws them, keeping focus
+            # on the same index, clamped to the new length
+            self.job_list.set_jobs(display_jobs)
 
-        for i, job in enumerate(display_jobs):
-            emoji = job.get_status_indicator()  # Use enhanced indicator
-            status_text = f"[{job.status.upper()}]"
-            
-            # Add selection indicator for multi-select mode
-            selection_indicator = ""
-            if self.multi_select_mode:
-                if id(job) in self.selected_jobs:
-                    selection_indicator = "☑ "  # Checked box
-                else:
-                    selection_indicator = "☐ "  # Empty box
-            
-            # Add interview info if present
-            interview_info = ""
-            if job.interview_date:
-                interview_info = f" | Int: {job.interview_date}"
-                if job.interview_time:
-                    interview_info += f" {job.interview_time}"
-            
-            display_text = f" {selection_indicator}{emoji} {status_text} {job.company} - {job.position} ({job.date_applied}){interview_info}"
-
-            # Get color scheme - prioritize attention level over status
-            attention_level = job.get_attention_level()
-            if attention_level == "urgent":
-                color_attr = "urgent"
-                focus_attr = "focus_urgent"
-            elif attention_level == "soon":
-                color_attr = "soon"
-                focus_attr = "focus_soon"
+    def _make_row(self, job, today: Optional[date] = None):
+        """Build the list row widget for a single job."""
+        emoji = job.get_status_indicator(today)  # Use enhanced indicator
+        
+        # Add selection indicator for multi-select mode
+        selection_indicator = ""
+        if self.multi_select_mode:
+            if job in self.selected_jobs:
+                selection_indicator = "☑ "  # Checked box
             else:
-                # Use normal status-based coloring
-                status_lower = job.status.lower()
-                color_attr = (
-                    status_lower
-                    if status_lower
-                    in ["applied", "interview", "offer", "rejected", "withdrawn"]
-                    else "body"
-                )
-                
-                # Check if focus attribute exists in palette
-                palette_names = [item[0] for item in self.PALETTE]
-                focus_attr = (
-                    f"focus_{status_lower}"
-                    if f"focus_{status_lower}" in palette_names
-                    else "focus"
-                )
-
-            # Create text widget with full-width highlighting using Columns
-            text_widget = urwid.Text(display_text)
-            # Use Columns with one column to ensure full width coverage
-            columns_widget = urwid.Columns([text_widget])
-            widget = urwid.AttrMap(
-                columns_widget,
-                color_attr,
-                focus_map=focus_attr
-            )
-
-            self.job_list.append(widget)
-
-    def _parse_date(self, date_str: str) -> datetime:
-        """Parse date string safely with fallback."""
-        try:
-            return datetime.strptime(date_str, "%Y-%m-%d")
-        except ValueError:
+                selection_indicator = "☐ "  # Empty box
+        
+        display_text = f" {selection_indicator}{emoji} {job.get_display_text()}"
+
+        # Get color scheme - prioritize attention level over status
+        row_attr = self._ATTENTION_ATTR.get(job.get_attention_level(today))
+        if row_attr is None:
+            # Use normal status-based coloring
+            row_attr = self._STATUS_ATTR.get(job.status, ("body", "focus"))
+        color_attr, focus_attr = row_attr
+
+        # Reuse the job's previous widget, updating it in place only when
+        # something visible about the row changed. Popping and reinserting
+        # keeps the cache in least-recently-used order.
+        cache_key = (display_text, color_attr, focus_attr)
+        row_cache = self._row_cache
+        cached = row_cache.pop(id(job), None)
+        if cached is not None:
+            widget = cached[1]
+            if cached[0] != cache_key:
+                widget.original_widget.set_text(display_text)
+                widget.set_attr_map({None: color_attr})
+                widget.set_focus_map({None: focus_attr})
+                cached = (cache_key, widget)
+            row_cache[id(job)] = cached
+            return widget
+
+        # Text pads its canvas to the full row width, so the AttrMap
+        # highlight spans the whole line without an extra container
+        widget = urwid.AttrMap(
+            urwid.Text(display_text),
+            color_attr,
+            focus_map=focus_attr
+        )
+        row_cache[id(job)] = (cache_key, widget)
+        if len(row_cache) > self.ROW_CACHE_SIZE:
+            del row_cache[next(iter(row_cache))]  # Evict the stalest row
+        return widget
+
+    def _parse_date(self, date_str: str) -> int:
+        """Parse date string to a sortable integer key with fallback."""
+        key = _date_key(date_str)
+        if key is None:
             # Fallback for invalid dates - put them at the end
-            return datetime.min if self.sort_ascending else datetime.max
+            return 0 if self.sort_ascending else 99999999
+        return key
 
     def _sort_jobs(self):
         """Apply current sorting mode to jobs list."""
@@ -517,19 +873,26 @@ class JobTrackerApp:
 
     def _sort_by_date(self):
         """Sort jobs by application date."""
-        self.jobs.sort(
-            key=lambda job: self._parse_date(job.date_applied),
-            reverse=not self.sort_ascending,
-        )
+        invalid = self._parse_date("")  # Where malformed dates sort
+
+        def sort_key(job):
+            key = job.get_date_key()
+            return key if key >= 0 else invalid
+
+        self.jobs.sort(key=sort_key, reverse=not self.sort_ascending)
 
     def _sort_by_status_date(self):
         """Sort jobs by status priority, then by date within each status."""
+        invalid = self._parse_date("")
+        status_priority = self.STATUS_PRIORITY
 
         def sort_key(job):
-            priority = self.status_priority.get(job.status, 999)
-            date = self._parse_date(job.date_applied)
+            priority = status_priority.get(job.status, 999)
+            date_key = job.get_date_key()
+            if date_key < 0:
+                date_key = invalid
             # For status+date, always sort dates newest first within status groups
-            return (priority, -date.timestamp())
+            return (priority, -date_key)
 
         self.jobs.sort(key=sort_key)
 
@@ -538,11 +901,51 @@ class JobTrackerApp:
         if not self.filter_text:
             self.filtered_jobs = self.jobs.copy()
         else:
-            filter_lower = self.filter_text.lower()
-            self.filtered_jobs = [
-                job for job in self.jobs
-                if filter_lower in job.company.lower() or filter_lower in job.position.lower()
-            ]
+            self.filtered_jobs = self._match_jobs(self.filter_text)
+
+    def _match_jobs(self, filter_text):
+        """Return the jobs whose company or position contains filter_text."""
+        filter_lower = filter_text.lower()
+        if "\n" in filter_lower:
+            # Could match across record boundaries in the joined index
+            return [job for job in self.jobs if filter_lower in job.get_search_key()]
+
+        # One C-level substring scan over every search key, then map each
+        # hit back to its job and resume the scan at the next record
+        jobs, haystack, starts = self._get_search_index()
+        find = haystack.find
+        last = len(starts) - 1
+        dense = len(jobs) // 32  # Past this many hits the plain loop wins
+        matches = []
+        pos = find(filter_lower)
+        while pos != -1:
+            i = bisect_right(starts, pos) - 1
+            matches.append(jobs[i])
+            if i == last:
+                break
+            if len(matches) > dense:
+                matches += [
+                    job for job in jobs[i + 1:] if filter_lower in job.get_search_key()
+                ]
+                break
+            pos = find(filter_lower, starts[i + 1])
+        return matches
+
+    def _get_search_index(self):
+        """Return the newline-joined search keys for the current job order."""
+        index = self._search_index
+        # List equality checks identity first, so this stays a C-level
+        # pass; sorting, adding and deleting jobs all make it stale
+        if index is None or index[0] != self.jobs:
+            keys = [job.get_search_key() for job in self.jobs]
+            starts = []
+            pos = 0
+            for key in keys:
+                starts.append(pos)
+                pos += len(key) + 1
+            index = (self.jobs.copy(), "\n".join(keys), starts)
+            self._search_index = index
+        return index
 
     def _set_filter(self, filter_text):
         """Set new filter text and apply it."""
@@ -568,17 +971,21 @@ class JobTrackerApp:
         self.sort_ascending = not self.sort_ascending
         self._apply_sort_and_refresh()
 
-    def _apply_sort_and_refresh(self):
-        """Apply current sort and refresh display, preserving focus if possible."""
-        # Try to preserve current job focus
-        focused_job = None
-        try:
-            if self.jobs and len(self.job_list) > 0:
-                focus_pos = self.job_list.focus
-                if 0 <= focus_pos < len(self.jobs):
-                    focused_job = self.jobs[focus_pos]
-        except (ValueError, TypeError, AttributeError):
-            pass
+    def _apply_sort_and_refresh(self, focused_job=None):
+        """Apply current sort and refresh display, preserving focus if possible.
+
+        Focus follows focused_job if given, otherwise the job focused now.
+        """
+        if focused_job is None:
+            # Try to preserve current job focus
+            try:
+                display_jobs = self._get_display_jobs()
+                if display_jobs and len(self.job_list) > 0:
+                    focus_pos = self.job_list.focus
+                    if 0 <= focus_pos < len(display_jobs):
+                        focused_job = display_jobs[focus_pos]
+            except (ValueError, TypeError, AttributeError):
+                pass
 
         # Apply sorting
         self._sort_jobs()
@@ -623,21 +1030,28 @@ class JobTrackerApp:
         """Show unified job form for add or edit mode."""
         is_edit_mode = job is not None
         form_title = "Edit Job Application" if is_edit_mode else "Add Job Application"
-        
-        # Create form widgets
-        self.form_widgets = self._create_form_widgets(job)
-        
-        # Build form layout (now returns a ListBox with focus management)
-        form_content = self._build_form_layout(form_title)
-        
-        # Create dialog (form_content is now a ListBox)
-        dialog = urwid.AttrMap(
-            urwid.LineBox(urwid.Padding(form_content, left=2, right=2)), "body"
-        )
-        
-        overlay = urwid.Overlay(
-            dialog, self.ui, align="center", width=80, valign="middle", height=25
-        )
+
+        if self._job_form_overlay is None:
+            # Create form widgets
+            self.form_widgets = self._create_form_widgets(job)
+
+            # Build form layout (now returns a ListBox with focus management)
+            form_content = self._build_form_layout(form_title)
+
+            # Create dialog (form_content is now a ListBox)
+            dialog = urwid.AttrMap(
+                urwid.LineBox(urwid.Padding(form_content, left=2, right=2)), "body"
+            )
+
+            self._job_form_overlay = urwid.Overlay(
+                dialog, self.ui, align="center", width=80, valign="middle", height=25
+            )
+        else:
+            # Reuse the form built on first open; only its contents change
+            self._fill_form_widgets(job)
+            self.form_title_text.set_text(("header", form_title))
+            self.form_listbox.set_focus(0)  # Scroll back to the top
+        overlay = self._job_form_overlay
         
         def handle_form_input(key):
             if key == "tab":
@@ -664,8 +1078,8 @@ class JobTrackerApp:
         # Set initial focus to the first form field
         self._focus_first_field()
 
-    def _create_form_widgets(self, job=None):
-        """Create all form field widgets, pre-populated if editing."""
+    def _get_form_values(self, job=None):
+        """Get the initial form field values for a job, or defaults for a new one."""
         # Pre-fill with job data if editing, or default values if adding
         if job:
             values = {
@@ -707,7 +1121,19 @@ class JobTrackerApp:
                 'salary_max': '',
                 'salary_offered': '',
             }
-        
+        return values
+
+    def _fill_form_widgets(self, job=None):
+        """Load a job's values, or new-job defaults, into the existing form fields."""
+        values = self._get_form_values(job)
+        for field_name, widget in self.form_widgets.items():
+            widget.set_edit_text(values[field_name])
+            widget.set_edit_pos(len(values[field_name]))  # As a new Edit would
+
+    def _create_form_widgets(self, job=None):
+        """Create all form field widgets, pre-populated if editing."""
+        values = self._get_form_values(job)
+
         # Create form field widgets
         widgets = {}
         
@@ -746,8 +1172,9 @@ class JobTrackerApp:
         content = []
         
         # Header
+        self.form_title_text = urwid.Text(("header", form_title), align="center")
         content.extend([
-            urwid.Text(("header", form_title), align="center"),
+            self.form_title_text,
             urwid.Divider(),
         ])
         
@@ -902,6 +1329,8 @@ class JobTrackerApp:
             original_job.salary_min = job_data['salary_min']
             original_job.salary_max = job_data['salary_max']
             original_job.salary_offered = job_data['salary_offered']
+            original_job.invalidate()
+            self._search_index = None  # Company/position may have changed
         else:
             # Create new job
             new_job = JobApplication(
@@ -924,13 +1353,40 @@ class JobTrackerApp:
                 salary_offered=job_data['salary_offered'],
             )
             self.jobs.append(new_job)
+            self._status_counts[new_job.status] += 1
         
         # Refresh and save
         self._apply_sort_and_refresh()
-        self.save_jobs()
+        self._schedule_save()
         return True
 
 
+    def _get_text_dialog(self, content, width, height):
+        """Show content in the shared text dialog frame and return its overlay.
+
+        The frame, box and overlay are built on first use; later dialogs
+        only swap the Pile's contents and resize the overlay. Dialogs that
+        take keys (delete confirmation, bulk status, bulk delete) install
+        their own unhandled_input handler around it.
+        """
+        if self._text_dialog is None:
+            dialog_content = urwid.Pile([])
+            dialog = urwid.Filler(
+                urwid.AttrMap(
+                    urwid.LineBox(urwid.Padding(dialog_content, left=2, right=2)), "body"
+                )
+            )
+            overlay = urwid.Overlay(
+                dialog, self.ui, align="center", width=width, valign="middle", height=height
+            )
+            self._text_dialog = (dialog_content, overlay)
+        dialog_content, overlay = self._text_dialog
+        dialog_content.contents[:] = [
+            (widget, dialog_content.options()) for widget in content
+        ]
+        overlay.set_overlay_parameters("center", width, "middle", height)
+        return overlay
+
     def _show_input_dialog(self, title, prompt, callback):
         """Show an input dialog."""
         edit = urwid.Edit(f"{prompt} ")
@@ -981,21 +1437,34 @@ class JobTrackerApp:
             """Update the preview of filter results."""
             current_text = edit.get_edit_text().strip()
             
-            # Temporarily apply filter to see results
-            temp_filter = self.filter_text
-            self._set_filter(current_text)
-            display_jobs = self._get_display_jobs()
-            
+            # Count matches without touching the applied filter
             if current_text:
-                if display_jobs:
-                    status_text.set_text(f"Found {len(display_jobs)} matches")
+                match_count = len(self._match_jobs(current_text))
+                if match_count:
+                    status_text.set_text(f"Found {match_count} matches")
                 else:
                     status_text.set_text("No matches found")
             else:
                 status_text.set_text(f"Showing all {len(self.jobs)} jobs")
-            
-            # Restore original filter for now
-            self._set_filter(temp_filter)
+
+        def schedule_preview(*args):
+            """Recount once typing pauses instead of on every keystroke."""
+            if self._preview_alarm is not None:
+                self.main_loop.remove_alarm(self._preview_alarm)
+            self._preview_alarm = self.main_loop.set_alarm_in(
+                self.PREVIEW_DELAY, run_preview
+            )
+
+        def run_preview(loop, user_data):
+            self._preview_alarm = None
+            update_filter_preview()
+
+        def close_dialog():
+            if self._preview_alarm is not None:
+                self.main_loop.remove_alarm(self._preview_alarm)
+                self._preview_alarm = None
+            self.main_loop.widget = self.ui
+            self.main_loop.unhandled_input = old_handler
 
         def handle_search_input(key):
             if key == "enter":
@@ -1003,28 +1472,24 @@ class JobTrackerApp:
                 new_filter = edit.get_edit_text().strip()
                 self._set_filter(new_filter)
                 self._refresh_job_list()
-                self.save_jobs()  # Save filter state
-                self.main_loop.widget = self.ui
-                self.main_loop.unhandled_input = old_handler
+                self._schedule_save()  # Save filter state
+                close_dialog()
                 
             elif key == "esc":
                 # Cancel - restore original filter
-                self.main_loop.widget = self.ui
-                self.main_loop.unhandled_input = old_handler
+                close_dialog()
                 
             elif key == "ctrl d":
                 # Clear filter
                 edit.set_edit_text("")
-                update_filter_preview()
                 
             else:
                 # Let the key pass through to edit widget
-                result = edit.keypress((0,), key)
-                update_filter_preview()  # Update preview after each keystroke
-                return result
+                return edit.keypress((0,), key)
 
-        # Initialize preview
+        # Initialize preview, then follow every edit, typed or pasted
         update_filter_preview()
+        urwid.connect_signal(edit, "postchange", schedule_preview)
 
         dialog_content = urwid.Pile([
             urwid.Text(("header", "Search/Filter Jobs"), align="center"),
@@ -1060,30 +1525,43 @@ class JobTrackerApp:
             focus_pos = self.job_list.focus
             if 0 <= focus_pos < len(display_jobs):
                 job = display_jobs[focus_pos]
-                # Find the actual index in the main jobs list
-                actual_index = self.jobs.index(job)
-                self._show_delete_confirmation(job, actual_index)
+                # Unfiltered, the display list is self.jobs itself; only a
+                # filtered view needs the (identity-compared) index scan
+                if display_jobs is self.jobs:
+                    actual_index = focus_pos
+                else:
+                    actual_index = self.jobs.index(job)
+                self._show_delete_confirmation(job, actual_index, focus_pos)
         except (ValueError, TypeError):
             pass
     
-    def _show_delete_confirmation(self, job, focus_pos):
+    def _show_delete_confirmation(self, job, job_index, display_pos):
         """Show confirmation dialog for job deletion."""
         def handle_input(key):
-            if key.lower() == 'y':
+            # Lowercase once; mouse events arrive as tuples
+            choice = key.lower() if isinstance(key, str) else key
+            if choice == 'y':
                 # Confirm deletion
-                del self.jobs[focus_pos]
-                self._refresh_job_list()
-                self.save_jobs()
-                
-                # Adjust focus position
-                if focus_pos >= len(self.jobs) and len(self.jobs) > 0:
-                    self.job_list.set_focus(len(self.jobs) - 1)
+                del self.jobs[job_index]
+                self._status_counts[job.status] -= 1
+                self._row_cache.pop(id(job), None)
+                self.selected_jobs.discard(job)
+                if self.filter_text:
+                    del self.filtered_jobs[display_pos]
+
+                if self._get_display_jobs():
+                    # Other rows are unchanged; they are rebuilt lazily on redraw
+                    self.job_list.set_jobs(self._get_display_jobs())
+                    self._update_header()
+                else:
+                    self._refresh_job_list()  # Show the empty-list message
+                self._schedule_save()
                     
                 # Close dialog
                 self.main_loop.widget = self.ui
                 self.main_loop.unhandled_input = old_handler
                 
-            elif key.lower() == 'n' or key == 'esc':
+            elif choice == 'n' or key == 'esc':
                 # Cancel deletion
                 self.main_loop.widget = self.ui
                 self.main_loop.unhandled_input = old_handler
@@ -1092,7 +1570,7 @@ class JobTrackerApp:
         
         # Build confirmation dialog
         job_info = f"{job.company} - {job.position}"
-        dialog_content = urwid.Pile([
+        overlay = self._get_text_dialog([
             urwid.Text(('header', 'Delete Job Application?'), align='center'),
             urwid.Divider(),
             urwid.Text(f"Company: {job.company}", align='center'),
@@ -1102,19 +1580,7 @@ class JobTrackerApp:
             urwid.Text(('focus', 'Are you sure you want to delete this job?'), align='center'),
             urwid.Divider(),
             urwid.Text("[Y]es to delete, [N]o to cancel, [Esc] to cancel", align='center')
-        ])
-        
-        dialog = urwid.Filler(
-            urwid.AttrMap(
-                urwid.LineBox(urwid.Padding(dialog_content, left=2, right=2)),
-                'body'
-            )
-        )
-        
-        overlay = urwid.Overlay(
-            dialog, self.ui, align='center', width=60,
-            valign='middle', height=12
-        )
+        ], width=60, height=12)
         
         old_handler = self.main_loop.unhandled_input
         self.main_loop.unhandled_input = handle_input
@@ -1130,20 +1596,14 @@ class JobTrackerApp:
             focus_pos = self.job_list.focus
             if 0 <= focus_pos < len(display_jobs):
                 current_job = display_jobs[focus_pos]
-                status_options = JobApplication.get_status_options()
-
-                try:
-                    current_index = status_options.index(current_job.status)
-                    next_index = (current_index + 1) % len(status_options)
-                except ValueError:
-                    next_index = 0
-
-                current_job.status = status_options[next_index]
-                self._apply_filter()  # Reapply filter after status change
-                self._refresh_job_list()
-                self.save_jobs()
-                # Restore focus to same position
-                self.job_list.set_focus(focus_pos)
+                self._status_counts[current_job.status] -= 1
+                current_job.status = _NEXT_STATUS.get(current_job.status, _STATUS_OPTIONS[0])
+                self._status_counts[current_job.status] += 1
+                current_job.invalidate()
+                # Filters match company and position only, so the visible
+                # list is unchanged and only this row needs rebuilding
+                self.job_list.refresh_row(focus_pos)
+                self._schedule_save()
         except (ValueError, TypeError):
             pass
 
@@ -1163,21 +1623,23 @@ class JobTrackerApp:
             elif new_pos >= len(self.job_list):
                 new_pos = len(self.job_list) - 1
 
-            self.job_list.set_focus(new_pos)
+            if new_pos != current_pos:  # Nothing to redraw at either end
+                self.job_list.set_focus(new_pos)
         except (ValueError, TypeError):
             pass
 
     def _move_to_top(self):
         """Move focus to the first job."""
         display_jobs = self._get_display_jobs()
-        if display_jobs:
+        if display_jobs and self.job_list.focus != 0:
             self.job_list.set_focus(0)
 
     def _move_to_bottom(self):
         """Move focus to the last job."""
         display_jobs = self._get_display_jobs()
-        if display_jobs:
-            self.job_list.set_focus(len(self.job_list) - 1)
+        last_pos = len(self.job_list) - 1
+        if display_jobs and self.job_list.focus != last_pos:
+            self.job_list.set_focus(last_pos)
 
     def _view_job_details(self):
         """Show detailed view of current job application."""
@@ -1262,28 +1724,17 @@ class JobTrackerApp:
             f"Notes: {job.notes if job.notes else 'None'}",
         ])
 
+        # The body lines share one left-aligned Text; urwid wraps each
+        # line on its own, so it renders the same as a Text per line
         content_widgets = [
-            urwid.Text(("header", f"Job Application Details"), align="center")
+            urwid.Text(("header", f"Job Application Details"), align="center"),
+            urwid.Divider(),
+            urwid.Text("\n".join(details)),
+            urwid.Divider(),
+            urwid.Text("Press any key to close", align="center"),
         ]
-        content_widgets.append(urwid.Divider())
-
-        for detail in details:
-            content_widgets.append(urwid.Text(detail))
 
-        content_widgets.append(urwid.Divider())
-        content_widgets.append(urwid.Text("Press any key to close", align="center"))
-
-        dialog_content = urwid.Pile(content_widgets)
-
-        dialog = urwid.Filler(
-            urwid.AttrMap(
-                urwid.LineBox(urwid.Padding(dialog_content, left=2, right=2)), "body"
-            )
-        )
-
-        overlay = urwid.Overlay(
-            dialog, self.ui, align="center", width=80, valign="middle", height=20
-        )
+        overlay = self._get_text_dialog(content_widgets, width=80, height=20)
 
         def close_dialog(key):
             self.main_loop.widget = self.ui
@@ -1300,10 +1751,9 @@ class JobTrackerApp:
             
         total_jobs = len(self.jobs)
         
-        # Count by status
-        status_counts = {}
-        for status in JobApplication.get_status_options():
-            status_counts[status] = sum(1 for job in self.jobs if job.status == status)
+        # Counts are kept current as jobs change; report every known status
+        counts = self._status_counts
+        status_counts = {status: counts[status] for status in _STATUS_OPTIONS}
         
         # Calculate success rates
         interviews = status_counts.get("Interview", 0)
@@ -1322,10 +1772,13 @@ class JobTrackerApp:
         applications_by_week = self._get_applications_by_timeframe("week")
         applications_by_month = self._get_applications_by_timeframe("month")
         
-        # Interview insights
-        upcoming_interviews = sum(1 for job in self.jobs if job.has_upcoming_interview())
-        overdue_followups = sum(1 for job in self.jobs if job.has_overdue_followup())
-        soon_followups = sum(1 for job in self.jobs if job.needs_followup_soon())
+        # Interview insights, gathered in a single pass with one clock read
+        today = date.today()
+        upcoming_interviews = overdue_followups = soon_followups = 0
+        for job in self.jobs:
+            upcoming_interviews += job.has_upcoming_interview(today=today)
+            overdue_followups += job.has_overdue_followup(today=today)
+            soon_followups += job.needs_followup_soon(today=today)
         
         return {
             "total_jobs": total_jobs,
@@ -1346,20 +1799,23 @@ class JobTrackerApp:
         if not self.jobs:
             return 0.0
             
-        # Get date range
-        dates = []
+        # Get date range and count in one pass, without collecting dates
+        earliest = latest = None
+        count = 0
         for job in self.jobs:
-            try:
-                date = datetime.strptime(job.date_applied, "%Y-%m-%d")
-                dates.append(date)
-            except ValueError:
+            app_date = _parse_ymd(job.date_applied)
+            if app_date is None:
                 continue
+            count += 1
+            if earliest is None:
+                earliest = latest = app_date
+            elif app_date < earliest:
+                earliest = app_date
+            elif app_date > latest:
+                latest = app_date
                 
-        if not dates:
+        if not count:
             return 0.0
-            
-        earliest = min(dates)
-        latest = max(dates)
         
         if timeframe == "week":
             delta = (latest - earliest).days / 7
@@ -1367,27 +1823,26 @@ class JobTrackerApp:
             delta = (latest - earliest).days / 30.44  # Average days per month
             
         if delta == 0:
-            return len(dates)
+            return count
             
-        return len(dates) / delta
+        return count / delta
     
     def _calculate_average_time_in_status(self):
         """Calculate average time spent in each status (simplified)."""
         # This is a simplified version - in a real app, you'd track status change dates
         # For now, we'll estimate based on application date and current status
         status_times = {}
+        now = datetime.now()
         
-        for status in JobApplication.get_status_options():
+        for status in _STATUS_OPTIONS:
             jobs_in_status = [job for job in self.jobs if job.status == status]
             if jobs_in_status:
                 total_days = 0
                 for job in jobs_in_status:
-                    try:
-                        app_date = datetime.strptime(job.date_applied, "%Y-%m-%d")
-                        days_since = (datetime.now() - app_date).days
+                    app_date = _parse_ymd(job.date_applied)
+                    if app_date is not None:
+                        days_since = (now - app_date).days
                         total_days += days_since
-                    except ValueError:
-                        continue
                         
                 avg_days = total_days / len(jobs_in_status) if jobs_in_status else 0
                 status_times[status] = avg_days
@@ -1423,7 +1878,7 @@ class JobTrackerApp:
             content.append(urwid.Text("STATUS BREAKDOWN:", align="left"))
             for status, count in stats['status_counts'].items():
                 percentage = (count / stats['total_jobs'] * 100) if stats['total_jobs'] > 0 else 0
-                emoji = JobApplication.get_status_emoji(status)
+                emoji = _STATUS_EMOJI.get(status, "📋")
                 content.append(urwid.Text(f"  {emoji} {status}: {count} ({percentage:.1f}%)", align="left"))
             
             content.append(urwid.Divider())
@@ -1462,7 +1917,7 @@ class JobTrackerApp:
             ])
             for status, days in avg_times.items():
                 if days > 0:
-                    emoji = JobApplication.get_status_emoji(status)
+                    emoji = _STATUS_EMOJI.get(status, "📋")
                     content.append(urwid.Text(f"  {emoji} {status}: {days:.1f} days", align="left"))
             
             content.extend([
@@ -1470,17 +1925,7 @@ class JobTrackerApp:
                 urwid.Text("Press any key to close", align="center")
             ])
         
-        dialog_content = urwid.Pile(content)
-        
-        dialog = urwid.Filler(
-            urwid.AttrMap(
-                urwid.LineBox(urwid.Padding(dialog_content, left=2, right=2)), "body"
-            )
-        )
-        
-        overlay = urwid.Overlay(
-            dialog, self.ui, align="center", width=60, valign="middle", height=25
-        )
+        overlay = self._get_text_dialog(content, width=60, height=25)
         
         def close_dialog(key):
             self.main_loop.widget = self.ui
@@ -1502,64 +1947,55 @@ class JobTrackerApp:
                 urwid.Text("Press any key to close", align="center")
             ]
         else:
-            # Sort jobs by application date
-            sorted_jobs = sorted(self.jobs, key=lambda j: self._parse_date(j.date_applied))
+            # Parse each application date once, dropping invalid ones, and
+            # sort the (date, job) pairs on the date alone
+            parse_ymd = _parse_ymd
+            dated_jobs = [(parse_ymd(job.date_applied), job) for job in self.jobs]
+            dated_jobs = sorted(
+                (pair for pair in dated_jobs if pair[0] is not None), key=itemgetter(0)
+            )
             
             content = [
                 urwid.Text(("header", "Application Timeline"), align="center"),
                 urwid.Divider(),
-                urwid.Text(f"Showing {len(sorted_jobs)} applications chronologically:", align="left"),
+                urwid.Text(f"Showing {len(self.jobs)} applications chronologically:", align="left"),
                 urwid.Divider(),
             ]
             
-            # Group by month for better visualization
+            # Group by month for better visualization. The lookups used per
+            # job are bound once, and every indicator shares one clock read.
+            today = date.today()
+            status_progress = _STATUS_PROGRESS
             current_month = None
-            for job in sorted_jobs:
-                try:
-                    app_date = datetime.strptime(job.date_applied, "%Y-%m-%d")
-                    month_key = app_date.strftime("%Y-%m")
+            for app_date, job in dated_jobs:
+                month_key = (app_date.year, app_date.month)
                     
-                    # Add month header if changed
-                    if month_key != current_month:
-                        current_month = month_key
-                        month_name = app_date.strftime("%B %Y")
-                        content.extend([
-                            urwid.Text(""),
-                            urwid.Text(f"=== {month_name.upper()} ===", align="center"),
-                        ])
+                # Add month header if changed
+                if month_key != current_month:
+                    current_month = month_key
+                    month_name = app_date.strftime("%B %Y")
+                    content.extend([
+                        urwid.Text(""),
+                        urwid.Text(f"=== {month_name.upper()} ===", align="center"),
+                    ])
                     
-                    # Application entry
-                    emoji = job.get_status_indicator()
-                    date_str = app_date.strftime("%m/%d")
+                # Application entry
+                emoji = job.get_status_indicator(today)
+                date_str = f"{app_date.month:02d}/{app_date.day:02d}"
                     
-                    # Add timeline markers
-                    timeline_info = f"{date_str} {emoji} {job.company} - {job.position}"
+                # Add timeline markers
+                timeline_info = f"{date_str} {emoji} {job.company} - {job.position}"
                     
-                    # Add interview info if present
-                    if job.interview_date:
-                        try:
-                            int_date = datetime.strptime(job.interview_date, "%Y-%m-%d")
-                            int_str = int_date.strftime("%m/%d")
-                            timeline_info += f" → Int: {int_str}"
-                        except ValueError:
-                            pass
+                # Add interview info if present
+                int_date = parse_ymd(job.interview_date)
+                if int_date is not None:
+                    timeline_info += f" → Int: {int_date.month:02d}/{int_date.day:02d}"
                     
-                    # Add status progression indicator
-                    status_indicators = {
-                        "Applied": "●",
-                        "Interview": "●●", 
-                        "Offer": "●●●",
-                        "Rejected": "●○○",
-                        "Withdrawn": "○○○"
-                    }
-                    progress = status_indicators.get(job.status, "●")
-                    timeline_info += f" [{progress}]"
+                # Add status progression indicator
+                progress = status_progress.get(job.status, "●")
+                timeline_info += f" [{progress}]"
                     
-                    content.append(urwid.Text(f"  {timeline_info}", align="left"))
-                    
-                except ValueError:
-                    # Skip jobs with invalid dates
-                    continue
+                content.append(urwid.Text(f"  {timeline_info}", align="left"))
             
             content.extend([
                 urwid.Divider(),
@@ -1567,17 +2003,7 @@ class JobTrackerApp:
                 urwid.Text("Press any key to close", align="center")
             ])
         
-        dialog_content = urwid.Pile(content)
-        
-        dialog = urwid.Filler(
-            urwid.AttrMap(
-                urwid.LineBox(urwid.Padding(dialog_content, left=2, right=2)), "body"
-            )
-        )
-        
-        overlay = urwid.Overlay(
-            dialog, self.ui, align="center", width=80, valign="middle", height=25
-        )
+        overlay = self._get_text_dialog(content, width=80, height=25)
         
         def close_dialog(key):
             self.main_loop.widget = self.ui
@@ -1607,14 +2033,16 @@ class JobTrackerApp:
             focus_pos = self.job_list.focus
             if 0 <= focus_pos < len(display_jobs):
                 job = display_jobs[focus_pos]
-                job_id = id(job)  # Use object ID as unique identifier
-                
-                if job_id in self.selected_jobs:
-                    self.selected_jobs.remove(job_id)
+
+                if job in self.selected_jobs:
+                    self.selected_jobs.remove(job)
                 else:
-                    self.selected_jobs.add(job_id)
-                    
-                self._refresh_job_list()
+                    self.selected_jobs.add(job)
+
+                # Only the checkbox on this row and the counts changed
+                self.job_list.refresh_row(focus_pos)
+                self._update_header()
+                self._update_footer()
         except (ValueError, TypeError):
             pass
 
@@ -1623,21 +2051,19 @@ class JobTrackerApp:
         if not self.multi_select_mode:
             return
             
-        display_jobs = self._get_display_jobs()
-        self.selected_jobs.clear()
-        
-        for job in display_jobs:
-            self.selected_jobs.add(id(job))
+        self.selected_jobs = set(self._get_display_jobs())
             
         self._refresh_job_list()
 
     def _get_selected_jobs(self):
         """Get list of currently selected jobs."""
-        if not self.multi_select_mode:
+        if not self.multi_select_mode or not self.selected_jobs:
             return []
             
+        # Walk the display list to keep the on-screen order
         display_jobs = self._get_display_jobs()
-        return [job for job in display_jobs if id(job) in self.selected_jobs]
+        selected = self.selected_jobs
+        return [job for job in display_jobs if job in selected]
 
     def _bulk_status_change(self):
         """Change status for all selected jobs."""
@@ -1650,7 +2076,7 @@ class JobTrackerApp:
 
     def _show_bulk_status_dialog(self, selected_jobs):
         """Show dialog to select status for bulk change."""
-        status_options = JobApplication.get_status_options()
+        status_options = _STATUS_OPTIONS
         
         content = [
             urwid.Text(("header", f"Bulk Status Change ({len(selected_jobs)} jobs)"), align="center"),
@@ -1674,7 +2100,7 @@ class JobTrackerApp:
         # Create status buttons
         status_widgets = []
         for i, status in enumerate(status_options):
-            emoji = JobApplication.get_status_emoji(status)
+            emoji = _STATUS_EMOJI.get(status, "📋")
             button_text = f"{i+1}. {emoji} {status}"
             status_widgets.append(urwid.Text(button_text, align="left"))
         
@@ -1688,43 +2114,30 @@ class JobTrackerApp:
             if key == "esc":
                 self.main_loop.widget = self.ui
                 self.main_loop.unhandled_input = old_handler
-            elif key in "12345":
-                try:
-                    status_idx = int(key) - 1
-                    if 0 <= status_idx < len(status_options):
-                        new_status = status_options[status_idx]
-                        
-                        # Apply status to all selected jobs
-                        for job in selected_jobs:
-                            job.status = new_status
-                            
-                        self._apply_filter()
-                        self._refresh_job_list()
-                        self.save_jobs()
-                        
-                        # Exit multi-select mode
-                        self.multi_select_mode = False
-                        self.selected_jobs.clear()
-                        self._refresh_job_list()
-                        
-                    self.main_loop.widget = self.ui
-                    self.main_loop.unhandled_input = old_handler
-                except ValueError:
-                    pass
+            elif key in _STATUS_BY_NUMBER_KEY:
+                new_status = _STATUS_BY_NUMBER_KEY[key]
+
+                # Apply status to all selected jobs
+                for job in selected_jobs:
+                    self._status_counts[job.status] -= 1
+                    job.status = new_status
+                    job.invalidate()
+                self._status_counts[new_status] += len(selected_jobs)
+
+                # Exit multi-select mode, then refresh once for both changes
+                self.multi_select_mode = False
+                self.selected_jobs.clear()
+
+                self._apply_filter()
+                self._refresh_job_list()
+                self._schedule_save()
+
+                self.main_loop.widget = self.ui
+                self.main_loop.unhandled_input = old_handler
             else:
                 return key
                 
-        dialog_content = urwid.Pile(content)
-        
-        dialog = urwid.Filler(
-            urwid.AttrMap(
-                urwid.LineBox(urwid.Padding(dialog_content, left=2, right=2)), "body"
-            )
-        )
-        
-        overlay = urwid.Overlay(
-            dialog, self.ui, align="center", width=70, valign="middle", height=20
-        )
+        overlay = self._get_text_dialog(content, width=70, height=20)
         
         old_handler = self.main_loop.unhandled_input
         self.main_loop.unhandled_input = handle_status_input
@@ -1762,41 +2175,34 @@ class JobTrackerApp:
         ])
         
         def handle_delete_input(key):
-            if key.lower() == 'y':
-                # Delete selected jobs
-                for job in selected_jobs:
-                    if job in self.jobs:
-                        self.jobs.remove(job)
+            # Lowercase once; mouse events arrive as tuples
+            choice = key.lower() if isinstance(key, str) else key
+            if choice == 'y':
+                # Delete selected jobs in one pass; jobs hash by identity
+                doomed = set(selected_jobs)
+                self.jobs[:] = [job for job in self.jobs if job not in doomed]
+                for job in doomed:
+                    self._status_counts[job.status] -= 1
+                    self._row_cache.pop(id(job), None)
                         
-                self._apply_filter()
-                self._refresh_job_list()
-                self.save_jobs()
-                
-                # Exit multi-select mode
+                # Exit multi-select mode, then refresh once for both changes
                 self.multi_select_mode = False
                 self.selected_jobs.clear()
+                
+                self._apply_filter()
                 self._refresh_job_list()
+                self._schedule_save()
                 
                 self.main_loop.widget = self.ui
                 self.main_loop.unhandled_input = old_handler
                 
-            elif key.lower() == 'n' or key == 'esc':
+            elif choice == 'n' or key == 'esc':
                 self.main_loop.widget = self.ui
                 self.main_loop.unhandled_input = old_handler
             else:
                 return key
                 
-        dialog_content = urwid.Pile(content)
-        
-        dialog = urwid.Filler(
-            urwid.AttrMap(
-                urwid.LineBox(urwid.Padding(dialog_content, left=2, right=2)), "body"
-            )
-        )
-        
-        overlay = urwid.Overlay(
-            dialog, self.ui, align="center", width=60, valign="middle", height=15
-        )
+        overlay = self._get_text_dialog(content, width=60, height=15)
         
         old_handler = self.main_loop.unhandled_input
         self.main_loop.unhandled_input = handle_delete_input
@@ -1804,6 +2210,9 @@ class JobTrackerApp:
 
     def _duplicate_job(self):
         """Duplicate the currently focused job."""
+        if self.multi_select_mode:
+            return
+            
         display_jobs = self._get_display_jobs()
         if not display_jobs:
             return
@@ -1814,10 +2223,11 @@ class JobTrackerApp:
                 original_job = display_jobs[focus_pos]
                 
                 # Create a copy of the job with some fields reset
+                today = datetime.now().strftime("%Y-%m-%d")
                 duplicate = JobApplication(
                     company=original_job.company,
                     position=original_job.position,
-                    date_applied=datetime.now().strftime("%Y-%m-%d"),  # Today's date
+                    date_applied=today,  # Today's date
                     status="Applied",  # Reset to Applied
                     link="",  # Clear link (likely different posting)
                     notes=f"Duplicated from {original_job.company} application",
@@ -1825,7 +2235,7 @@ class JobTrackerApp:
                     interview_date="",  # Clear specific dates
                     interview_time=original_job.interview_time,  # Keep time as template
                     interview_type=original_job.interview_type,  # Keep type as template
-                    last_contact=datetime.now().strftime("%Y-%m-%d"),  # Today
+                    last_contact=today,  # Today
                     next_followup="",  # Clear specific dates
                     salary_min=original_job.salary_min,  # Keep salary info
                     salary_max=original_job.salary_max,
@@ -1836,24 +2246,19 @@ class JobTrackerApp:
                 )
                 
                 self.jobs.append(duplicate)
-                self._apply_sort_and_refresh()
-                self.save_jobs()
-                
-                # Try to focus on the newly duplicated job
-                try:
-                    display_jobs = self._get_display_jobs()
-                    new_index = display_jobs.index(duplicate)
-                    if 0 <= new_index < len(self.job_list):
-                        self.job_list.set_focus(new_index)
-                except (ValueError, AttributeError):
-                    if len(self.job_list) > 0:
-                        self.job_list.set_focus(0)
-                        
+                self._status_counts[duplicate.status] += 1
+                # Focus on the newly duplicated job
+                self._apply_sort_and_refresh(focused_job=duplicate)
+                self._schedule_save()
+
         except (ValueError, TypeError):
             pass
 
     def _quick_add_similar(self):
         """Quick add a job similar to the current one with minimal prompts."""
+        if self.multi_select_mode:
+            return
+            
         display_jobs = self._get_display_jobs()
         if not display_jobs:
             return
@@ -1870,34 +2275,67 @@ class JobTrackerApp:
         """Show quick add dialog using template job."""
         self._quick_add_data = {"template": template_job}
         self._quick_add_step = 0
+        self._quick_add_today = datetime.now().strftime("%Y-%m-%d")
         self._start_quick_add()
 
     def _start_quick_add(self):
         """Start quick add process with minimal required fields."""
-        steps = [
-            ("Company Name", f"Company name (was: {self._quick_add_data['template'].company}):", "company", True),
-            ("Position", f"Position (was: {self._quick_add_data['template'].position}):", "position", False),
-            ("Application Date", f"Date applied ({datetime.now().strftime('%Y-%m-%d')}):", "date_applied", False),
-        ]
-        
-        if self._quick_add_step < len(steps):
-            title, prompt, field, required = steps[self._quick_add_step]
-            
+        if self._quick_add_step < _QUICK_ADD_STEP_COUNT:
+            title, prompt, field, required = _QUICK_ADD_STEPS[self._quick_add_step]
+            template = self._quick_add_data["template"]
+            today = self._quick_add_today
+            prompt = prompt.format(
+                company=template.company, position=template.position, today=today
+            )
+
             # Pre-fill with template data or current date
             if field == "date_applied":
-                default_value = datetime.now().strftime("%Y-%m-%d")
+                default_value = today
             elif field == "position":
-                default_value = self._quick_add_data['template'].position
+                default_value = template.position
             else:
                 default_value = ""
-                
+
             self._show_quick_add_input_dialog(title, prompt, field, required, default_value)
         else:
             self._finalize_quick_add()
 
+    def _get_quick_add_dialog(self):
+        """Build the quick add step dialog once; each step only updates its text."""
+        if self._quick_add_dialog is None:
+            title_text = urwid.Text("", align="center")
+            step_text = urwid.Text("", align="center")
+            edit = urwid.Edit()
+
+            dialog_content = urwid.Pile([
+                title_text,
+                step_text,
+                urwid.Divider(),
+                edit,
+                urwid.Divider(),
+                urwid.Text("Press Enter to continue, Esc to cancel", align="center"),
+            ])
+
+            dialog = urwid.Filler(
+                urwid.AttrMap(
+                    urwid.LineBox(urwid.Padding(dialog_content, left=2, right=2)), "body"
+                )
+            )
+
+            overlay = urwid.Overlay(
+                dialog, self.ui, align="center", width=50, valign="middle", height=9
+            )
+            self._quick_add_dialog = (title_text, step_text, edit, overlay)
+        return self._quick_add_dialog
+
     def _show_quick_add_input_dialog(self, title, prompt, field, required, default_value=""):
         """Show input dialog for quick add step."""
-        edit = urwid.Edit(f"{prompt} ", default_value)
+        title_text, step_text, edit, overlay = self._get_quick_add_dialog()
+        title_text.set_text(("header", f"Quick Add - {title}"))
+        step_text.set_text(("body", f"Step {self._quick_add_step + 1} of {_QUICK_ADD_STEP_COUNT}"))
+        edit.set_caption(f"{prompt} ")
+        edit.set_edit_text(default_value)
+        edit.set_edit_pos(len(default_value))
 
         def handle_input(key):
             if key == "enter":
@@ -1917,25 +2355,6 @@ class JobTrackerApp:
             else:
                 return key
 
-        dialog_content = urwid.Pile([
-            urwid.Text(("header", f"Quick Add - {title}"), align="center"),
-            urwid.Text(("body", f"Step {self._quick_add_step + 1} of 3"), align="center"),
-            urwid.Divider(),
-            edit,
-            urwid.Divider(),
-            urwid.Text("Press Enter to continue, Esc to cancel", align="center"),
-        ])
-
-        dialog = urwid.Filler(
-            urwid.AttrMap(
-                urwid.LineBox(urwid.Padding(dialog_content, left=2, right=2)), "body"
-            )
-        )
-
-        overlay = urwid.Overlay(
-            dialog, self.ui, align="center", width=50, valign="middle", height=9
-        )
-
         old_handler = self.main_loop.unhandled_input
         self.main_loop.unhandled_input = handle_input
         self.main_loop.widget = overlay
@@ -1943,42 +2362,45 @@ class JobTrackerApp:
     def _finalize_quick_add(self):
         """Create job from quick add with template data."""
         template = self._quick_add_data["template"]
-        
+        today = self._quick_add_today
+
         job = JobApplication(
             company=self._quick_add_data.get("company", ""),
             position=self._quick_add_data.get("position", template.position),
-            date_applied=self._quick_add_data.get("date_applied", datetime.now().strftime("%Y-%m-%d")),
+            date_applied=self._quick_add_data.get("date_applied", today),
             status="Applied",
             link="",
             notes=f"Quick-added using {template.company} as template",
             # Inherit template settings
             interview_time=template.interview_time,
             interview_type=template.interview_type,
-            last_contact=datetime.now().strftime("%Y-%m-%d"),
+            last_contact=today,
             salary_min=template.salary_min,
             salary_max=template.salary_max,
             recruiter_name=template.recruiter_name if template.recruiter_name else "",
         )
         
         self.jobs.append(job)
-        self._apply_sort_and_refresh()
-        self.save_jobs()
-        
-        # Focus on new job
-        try:
-            display_jobs = self._get_display_jobs()
-            new_index = display_jobs.index(job)
-            if 0 <= new_index < len(self.job_list):
-                self.job_list.set_focus(new_index)
-        except (ValueError, AttributeError):
-            if len(self.job_list) > 0:
-                self.job_list.set_focus(0)
+        self._status_counts[job.status] += 1
+        self._apply_sort_and_refresh(focused_job=job)  # Focus on new job
+        self._schedule_save()
 
     def _show_reminders_dialog(self):
         """Show smart reminders for jobs needing attention."""
-        jobs_needing_attention = [job for job in self.jobs if job.needs_attention()]
-        
-        if not jobs_needing_attention:
+        # Bucket jobs by attention level in one pass with one clock read
+        now = datetime.now()
+        today = now.date()
+        urgent_jobs = []
+        soon_jobs = []
+        for job in self.jobs:
+            level = job.get_attention_level(today)
+            if level == "urgent":
+                urgent_jobs.append(job)
+            elif level == "soon":
+                soon_jobs.append(job)
+        attention_count = len(urgent_jobs) + len(soon_jobs)
+        
+        if not attention_count:
             content = [
                 urwid.Text(("header", "Smart Reminders"), align="center"),
                 urwid.Divider(),
@@ -1991,24 +2413,20 @@ class JobTrackerApp:
             content = [
                 urwid.Text(("header", "Smart Reminders"), align="center"),
                 urwid.Divider(),
-                urwid.Text(f"📢 {len(jobs_needing_attention)} jobs need your attention:", align="left"),
+                urwid.Text(f"📢 {attention_count} jobs need your attention:", align="left"),
                 urwid.Divider(),
             ]
             
-            # Group by attention level
-            urgent_jobs = [job for job in jobs_needing_attention if job.get_attention_level() == "urgent"]
-            soon_jobs = [job for job in jobs_needing_attention if job.get_attention_level() == "soon"]
-            
             if urgent_jobs:
                 content.append(urwid.Text("🚨 URGENT - Overdue follow-ups:", align="left"))
                 for job in urgent_jobs:
                     reminder_text = f"  • {job.company} - {job.position}"
                     if job.next_followup:
-                        try:
-                            followup_date = datetime.strptime(job.next_followup, "%Y-%m-%d")
-                            days_overdue = (datetime.now() - followup_date).days
+                        followup_date = _parse_ymd(job.next_followup)
+                        if followup_date is not None:
+                            days_overdue = (now - followup_date).days
                             reminder_text += f" (overdue {days_overdue} days)"
-                        except ValueError:
+                        else:
                             reminder_text += " (follow-up overdue)"
                     content.append(urwid.Text(reminder_text, align="left"))
                 content.append(urwid.Divider())
@@ -2017,22 +2435,22 @@ class JobTrackerApp:
                 content.append(urwid.Text("⏰ COMING UP - Action needed soon:", align="left"))
                 for job in soon_jobs:
                     reminder_text = f"  • {job.company} - {job.position}"
-                    if job.has_upcoming_interview():
+                    if job.has_upcoming_interview(today=today):
                         if job.interview_date:
-                            try:
-                                int_date = datetime.strptime(job.interview_date, "%Y-%m-%d")
-                                days_until = (int_date - datetime.now()).days
+                            int_date = _parse_ymd(job.interview_date)
+                            if int_date is not None:
+                                days_until = (int_date - now).days
                                 time_info = f" at {job.interview_time}" if job.interview_time else ""
                                 reminder_text += f" - Interview in {days_until} days{time_info}"
-                            except ValueError:
+                            else:
                                 reminder_text += " - Interview scheduled"
-                    elif job.needs_followup_soon():
+                    elif job.needs_followup_soon(today=today):
                         if job.next_followup:
-                            try:
-                                followup_date = datetime.strptime(job.next_followup, "%Y-%m-%d")
-                                days_until = (followup_date - datetime.now()).days
+                            followup_date = _parse_ymd(job.next_followup)
+                            if followup_date is not None:
+                                days_until = (followup_date - now).days
                                 reminder_text += f" - Follow-up due in {days_until} days"
-                            except ValueError:
+                            else:
                                 reminder_text += " - Follow-up due soon"
                     content.append(urwid.Text(reminder_text, align="left"))
             
@@ -2042,17 +2460,7 @@ class JobTrackerApp:
                 urwid.Text("Press any key to close", align="center")
             ])
         
-        dialog_content = urwid.Pile(content)
-        
-        dialog = urwid.Filler(
-            urwid.AttrMap(
-                urwid.LineBox(urwid.Padding(dialog_content, left=2, right=2)), "body"
-            )
-        )
-        
-        overlay = urwid.Overlay(
-            dialog, self.ui, align="center", width=80, valign="middle", height=20
-        )
+        overlay = self._get_text_dialog(content, width=80, height=20)
         
         def close_dialog(key):
             self.main_loop.widget = self.ui
@@ -2062,90 +2470,90 @@ class JobTrackerApp:
         self.main_loop.unhandled_input = close_dialog
         self.main_loop.widget = overlay
 
+    def _build_keymap(self):
+        """Build the key -> handler table used by _handle_input.
+
+        Letter keys also answer to their uppercase form (so Caps Lock
+        still works) unless that form has its own binding, like G.
+        """
+        keymap = {
+            "q": self._quit,
+            "a": self._add_job,
+            "e": self._edit_job,
+            "d": self._delete_current_job,
+            "s": self._cycle_job_status,
+            "v": self._view_job_details,
+            "enter": self._view_job_details,
+
+            # Sorting controls
+            "o": self._toggle_sort_direction,
+            "t": self._toggle_sort_mode,
+
+            # Search/filter control
+            "/": self._show_search_dialog,
+
+            # Statistics, timeline and smart reminders views
+            "i": self._show_statistics_dialog,
+            "l": self._show_timeline_dialog,
+            "r": self._show_reminders_dialog,
+
+            # Multi-select operations (handlers ignore keys outside the mode)
+            "m": self._toggle_multi_select_mode,
+            " ": self._toggle_selection,  # Space to toggle selection
+            "ctrl a": self._select_all,
+            "b": self._bulk_status_change,
+            "ctrl d": self._bulk_delete,
+
+            # Quick productivity features
+            "c": self._duplicate_job,
+            "ctrl q": self._quick_add_similar,
+
+            # VIM navigation bindings
+            "j": lambda: self._move_focus(1),
+            "down": lambda: self._move_focus(1),
+            "k": lambda: self._move_focus(-1),
+            "up": lambda: self._move_focus(-1),
+            "g": self._move_to_top,
+            "G": self._move_to_bottom,
+        }
+        for key, handler in list(keymap.items()):
+            if len(key) == 1:
+                keymap.setdefault(key.upper(), handler)
+        return keymap
+
+    def _quit(self):
+        """Leave the main loop; run() saves on the way out."""
+        raise urwid.ExitMainLoop()
+
     def _handle_input(self, key):
         """Handle keyboard input."""
-        # Convert key to string and handle special keys safely
-        key_str = str(key).lower() if isinstance(key, str) else str(key)
-        
-        if key_str == "q":
-            self.save_jobs()
-            raise urwid.ExitMainLoop()
-        elif key_str == "a":
-            self._add_job()
-        elif key_str == "e":
-            self._edit_job()
-        elif key_str == "d":
-            self._delete_current_job()
-        elif key_str == "s":
-            self._cycle_job_status()
-        elif key_str == "v" or key == "enter":
-            self._view_job_details()
-
-        # Sorting controls
-        elif key_str == "o":
-            self._toggle_sort_direction()
-        elif key_str == "t":
-            self._toggle_sort_mode()
-
-        # Search/filter control
-        elif key_str == "/" or key == "/":
-            self._show_search_dialog()
-
-        # Statistics view
-        elif key_str == "i":
-            self._show_statistics_dialog()
-
-        # Timeline view
-        elif key_str == "l":
-            self._show_timeline_dialog()
-
-        # Smart reminders
-        elif key_str == "r":
-            self._show_reminders_dialog()
-
-        # Multi-select operations
-        elif key_str == "m":
-            self._toggle_multi_select_mode()
-        elif key_str == " " and self.multi_select_mode:  # Space to toggle selection
-            self._toggle_selection()
-        elif key == "ctrl a" and self.multi_select_mode:  # Ctrl+A to select all
-            self._select_all()
-        elif key_str == "b" and self.multi_select_mode and self.selected_jobs:  # Bulk status change
-            self._bulk_status_change()
-        elif key == "ctrl d" and self.multi_select_mode and self.selected_jobs:  # Ctrl+D to bulk delete
-            self._bulk_delete()
-
-        # Quick productivity features  
-        elif key_str == "c" and not self.multi_select_mode:  # Copy/duplicate current job
-            self._duplicate_job()
-        elif key == "ctrl q" and not self.multi_select_mode:  # Quick add similar
-            self._quick_add_similar()
-
-        # VIM navigation bindings
-        elif key_str == "j" or key == "down":
-            self._move_focus(1)
-        elif key_str == "k" or key == "up":
-            self._move_focus(-1)
-        elif key_str == "g":
-            self._move_to_top()
-        elif key == "G":  # Keep original case for uppercase G
-            self._move_to_bottom()
+        # One lookup; uppercase letters are in the table already
+        handler = self._keymap.get(key)
+        if handler is not None:
+            handler()
 
         # Return key for other handlers
         return key
 
     def run(self):
         """Start the application."""
+        self._aio_loop = asyncio.new_event_loop()
         self.main_loop = urwid.MainLoop(
-            self.ui, palette=self.PALETTE, unhandled_input=self._handle_input
+            self.ui,
+            palette=self.PALETTE,
+            unhandled_input=self._handle_input,
+            event_loop=urwid.AsyncioEventLoop(loop=self._aio_loop),
         )
+        self.main_loop.set_alarm_in(0, self._deferred_load)
 
         try:
             self.main_loop.run()
         except KeyboardInterrupt:
-            self.save_jobs()
+            pass
         finally:
+            # The single save for every exit path: quit, signal or Ctrl+C
             self.save_jobs()
+            self._aio_loop.close()
 
 
 def main():